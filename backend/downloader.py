@@ -4,16 +4,18 @@ Wraps yt-dlp for threaded downloads with progress callbacks.
 """
 
 import os
-import uuid
+import time
+import secrets
 import re
 import sys
 import shutil
+import queue
 from urllib.parse import urlparse
 import threading
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable, Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, Tuple, List
 import yt_dlp
 
 
@@ -24,14 +26,41 @@ WINDOWS_RESERVED_NAMES = {
 }
 
 
+_SPEED_UNITS = ("B/s", "KB/s", "MB/s", "GB/s")
+
+# Directories probed for bundled binaries (ffmpeg etc.); none of these
+# change at runtime, so compute the list once at import
+_BINARY_SEARCH_DIRS = tuple(filter(None, [
+    getattr(sys, "_MEIPASS", None),
+    os.getcwd(),
+    os.path.dirname(__file__),
+    os.path.dirname(sys.executable),
+    os.path.join(os.path.dirname(sys.executable), "ffmpeg"),
+    os.path.normpath(os.path.join(os.path.dirname(sys.executable), "..", "ffmpeg")),
+]))
+
+_PLATFORM_MAP = {
+    "youtube.com": "youtube",
+    "youtu.be": "youtube",
+    "tiktok.com": "tiktok",
+    "instagram.com": "instagram",
+    "facebook.com": "facebook",
+    "fb.watch": "facebook",
+    "twitter.com": "twitter",
+    "x.com": "twitter",
+    "twitch.tv": "twitch",
+}
+
+
+# Characters not allowed in Windows filenames (\ / : * ? " < > |) plus control chars
+_INVALID_FN_CHARS = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+_WHITESPACE_RUNS = re.compile(r'\s+')
+
+
 def sanitize_filename(filename: str) -> str:
     """Remove or replace characters that are invalid in Windows filenames."""
-    # Characters not allowed in Windows filenames: \ / : * ? " < > |
-    invalid_chars = r'[\\/:*?"<>|]'
-    sanitized = re.sub(invalid_chars, '_', filename)
-    # Also replace any control characters
-    sanitized = re.sub(r'[\x00-\x1f]', '', sanitized)
-    sanitized = re.sub(r'\s+', ' ', sanitized).strip()
+    sanitized = _INVALID_FN_CHARS.sub('_', filename)
+    sanitized = _WHITESPACE_RUNS.sub(' ', sanitized).strip()
     sanitized = sanitized.rstrip('. ')
 
     if not sanitized:
@@ -47,7 +76,7 @@ def sanitize_filename(filename: str) -> str:
     return sanitized
 
 
-class DownloadStatus(Enum):
+class DownloadStatus(str, Enum):
     PENDING = "pending"
     FETCHING_INFO = "fetching_info"
     DOWNLOADING = "downloading"
@@ -56,7 +85,7 @@ class DownloadStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadTask:
     task_id: str
     url: str
@@ -70,33 +99,101 @@ class DownloadTask:
     downloaded_bytes: int = 0
     title: str = ""
     thumbnail: str = ""
+    # Guards this task's mutable fields; the manager lock only guards the tasks dict
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    # Monotonic timestamp of the last progress callback emitted for this task
+    last_emit: float = 0.0
+    # Set by cancel_task; the progress hook aborts the yt-dlp run when it fires
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+
+    def snapshot(self) -> "DownloadTaskSnapshot":
+        """Capture an immutable copy of the current state. Caller holds self.lock."""
+        return DownloadTaskSnapshot(
+            task_id=self.task_id,
+            url=self.url,
+            status=self.status,
+            progress=self.progress,
+            speed=self.speed,
+            eta=self.eta,
+            filename=self.filename,
+            error=self.error,
+            total_bytes=self.total_bytes,
+            downloaded_bytes=self.downloaded_bytes,
+            title=self.title,
+            thumbnail=self.thumbnail,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class DownloadTaskSnapshot:
+    """Point-in-time copy of a DownloadTask, safe to read from any thread."""
+    task_id: str
+    url: str
+    status: DownloadStatus
+    progress: float
+    speed: str
+    eta: str
+    filename: str
+    error: Optional[str]
+    total_bytes: int
+    downloaded_bytes: int
+    title: str
+    thumbnail: str
 
 
 class DownloadManager:
     """Thread-safe download manager using yt-dlp."""
     
-    def __init__(self, output_dir: Optional[str] = None):
+    def __init__(
+        self,
+        output_dir: Optional[str] = None,
+        fragment_concurrency: Optional[int] = None,
+        max_workers: int = 8,
+    ):
         self.output_dir = output_dir or os.path.join(os.path.expanduser("~"), "Downloads", "GravityDown")
         os.makedirs(self.output_dir, exist_ok=True)
+
+        # Parallel fragment fetches for HLS/DASH streams; ignored for plain HTTP downloads
+        self.fragment_concurrency = fragment_concurrency or 4
+
+        # Shared cookie jar so consecutive yt-dlp sessions against the same
+        # host can resume cookies/connections instead of starting cold
+        self._cookiefile = os.path.join(self.output_dir, ".cookies.txt")
+
+        # Persistent yt-dlp cache so YouTube signature/nsig routines are
+        # decrypted once instead of on every extraction
+        self._cachedir = os.path.join(self.output_dir, ".yt-dlp-cache")
+        os.makedirs(self._cachedir, exist_ok=True)
+
+        # ffmpeg location resolved lazily once; it doesn't move at runtime
+        self._ffmpeg_location: Optional[str] = None
+        self._ffmpeg_resolved = False
         
         self.tasks: Dict[str, DownloadTask] = {}
-        self.executor = ThreadPoolExecutor(max_workers=3)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dlworker")
+        # Bound the amount of queued work so a flood of requests blocks at
+        # submission instead of piling up unbounded behind the executor
+        self._queue_semaphore = threading.BoundedSemaphore(max_workers * 4)
         self._lock = threading.Lock()
-        self._callbacks: Dict[str, Callable[[DownloadTask], None]] = {}
+        self._callbacks: Dict[str, Callable[[DownloadTaskSnapshot], None]] = {}
+        # Memoized extract_info results: url -> (monotonic timestamp, info dict)
+        self._info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+        # Progress callbacks are delivered from a dedicated thread so a slow
+        # consumer (UI marshaling, DB writes) never throttles the downloaders
+        self._callback_queue: queue.Queue = queue.Queue(maxsize=256)
+        self._callback_thread = threading.Thread(target=self._dispatch_callbacks, daemon=True)
+        self._callback_thread.start()
     
     def _format_speed(self, speed: Optional[float]) -> str:
         """Format speed in human-readable format."""
         if not speed:
             return "0 B/s"
-        
-        units = ["B/s", "KB/s", "MB/s", "GB/s"]
-        unit_index = 0
-        
-        while speed >= 1024 and unit_index < len(units) - 1:
-            speed /= 1024
-            unit_index += 1
-        
-        return f"{speed:.1f} {units[unit_index]}"
+
+        # Unit index straight from the bit length (one unit per 2**10 step)
+        # instead of a divide loop; this runs on every progress tick
+        unit_index = min((int(speed).bit_length() - 1) // 10, 3) if speed >= 1 else 0
+        return f"{speed / (1 << (10 * unit_index)):.1f} {_SPEED_UNITS[unit_index]}"
     
     def _format_eta(self, eta: Optional[float]) -> str:
         """Format ETA in human-readable format."""
@@ -118,30 +215,38 @@ class DownloadManager:
         if env_path and os.path.isfile(env_path):
             return env_path
 
-        candidates = []
-        base_dir = getattr(sys, "_MEIPASS", None)
-        if base_dir:
-            candidates.append(os.path.join(base_dir, binary_name))
-        candidates.append(os.path.join(os.getcwd(), binary_name))
-        candidates.append(os.path.join(os.path.dirname(__file__), binary_name))
-        candidates.append(os.path.join(os.path.dirname(sys.executable), binary_name))
-        candidates.append(os.path.join(os.path.dirname(sys.executable), "ffmpeg", binary_name))
-        candidates.append(os.path.join(os.path.dirname(sys.executable), "..", "ffmpeg", binary_name))
-
-        for path in candidates:
+        for directory in _BINARY_SEARCH_DIRS:
+            path = os.path.join(directory, binary_name)
             if os.path.isfile(path):
                 return path
 
         return shutil.which(binary_name)
 
+    def _get_ffmpeg_location(self) -> Optional[str]:
+        """Resolve the ffmpeg directory once and reuse it for every download."""
+        with self._lock:
+            if self._ffmpeg_resolved:
+                return self._ffmpeg_location
+
+        ffmpeg_path = self._find_binary("ffmpeg.exe", "FFMPEG_PATH") or self._find_binary("ffmpeg", "FFMPEG_PATH")
+        location = os.path.dirname(ffmpeg_path) if ffmpeg_path else None
+
+        with self._lock:
+            self._ffmpeg_location = location
+            self._ffmpeg_resolved = True
+
+        return location
+
     def _normalize_url(self, url: str) -> str:
         """Ensure URL has a scheme for proper extractor selection."""
         value = (url or "").strip()
         if not value:
             return value
 
-        parsed = urlparse(value)
-        if parsed.scheme:
+        # Fast path: almost every input already carries a scheme
+        if value.startswith(("http://", "https://", "ftp://", "rtmp://", "rtsp://")):
+            return value
+        if "://" in value:
             return value
 
         return f"https://{value}"
@@ -150,9 +255,15 @@ class DownloadManager:
         """yt-dlp progress hook callback."""
         with self._lock:
             task = self.tasks.get(task_id)
-            if not task:
-                return
-            
+        if not task:
+            return
+
+        # Abort the yt-dlp run as soon as a cancellation is requested; this
+        # frees the worker thread instead of letting the download run out
+        if task.cancel_event.is_set():
+            raise yt_dlp.utils.DownloadCancelled("Cancelled by user")
+
+        with task.lock:
             status = d.get("status", "")
             
             if status == "downloading":
@@ -170,87 +281,126 @@ class DownloadManager:
             elif status == "finished":
                 task.status = DownloadStatus.PROCESSING
                 task.progress = 100.0
-                task.filename = d.get("filename", "")
+                info_dict = d.get("info_dict") or {}
+                task.filename = info_dict.get("_filename") or d.get("filename", "")
             
             elif status == "error":
                 task.status = DownloadStatus.ERROR
                 task.error = str(d.get("error", "Unknown error"))
-        
-        # Notify callback
-        if task_id in self._callbacks:
-            self._callbacks[task_id](task)
+
+            # Coalesce downloading ticks: at most one callback per 100 ms per
+            # task; state transitions (finished/error) always go through
+            now = time.monotonic()
+            if status == "downloading" and now - task.last_emit < 0.1:
+                return
+            task.last_emit = now
+            snap = task.snapshot()
+
+        # Notify callback fire-and-forget; progress updates are lossy, so a
+        # full queue just drops the tick
+        try:
+            self._callback_queue.put_nowait((task_id, snap))
+        except queue.Full:
+            pass
+
+    def _dispatch_callbacks(self) -> None:
+        """Deliver queued progress callbacks to consumers."""
+        while True:
+            task_id, snap = self._callback_queue.get()
+            cb = self._callbacks.get(task_id)
+            if cb:
+                try:
+                    cb(snap)
+                except Exception:
+                    pass
     
-    def get_video_info(self, url: str) -> Dict[str, Any]:
-        """Fetch video metadata without downloading."""
-        url = self._normalize_url(url)
+    def _cached_extract(self, url: str, flat: bool = False, ttl: float = 300.0) -> Optional[Dict[str, Any]]:
+        """Extract video info, memoizing results per URL with a TTL.
+
+        Avoids paying the full extractor cost twice on the common
+        "Get Info" then "Download" flow.
+        """
+        with self._lock:
+            cached = self._info_cache.get(url)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
         ydl_opts = {
             "quiet": True,
             "no_warnings": True,
-            "extract_flat": False,
+            "extract_flat": flat,
+            "cookiefile": self._cookiefile,
+            "cachedir": self._cachedir,
+            "http_headers": {"Connection": "keep-alive"},
         }
-        
+
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             info = ydl.extract_info(url, download=False)
-            
-            if not info:
-                raise ValueError("Could not extract video info")
-            
-            # Extract available formats
-            formats = []
-            seen_resolutions = set()
-            
-            for f in info.get("formats", []):
-                height = f.get("height")
-                vcodec = f.get("vcodec", "none")
-                acodec = f.get("acodec", "none")
-                
-                # Video formats
-                if height and vcodec != "none":
-                    resolution = f"{height}p"
-                    if resolution not in seen_resolutions:
-                        seen_resolutions.add(resolution)
-                        formats.append({
-                            "format_id": f.get("format_id"),
-                            "resolution": resolution,
-                            "height": height,
-                            "ext": f.get("ext"),
-                            "type": "video",
-                            "has_audio": acodec != "none",
-                            "filesize": f.get("filesize") or f.get("filesize_approx"),
-                        })
-            
-            # Sort by resolution (descending)
-            formats.sort(key=lambda x: x.get("height", 0), reverse=True)
-            
-            duration = info.get("duration")
-            if isinstance(duration, float):
-                duration = int(duration)
-
-            return {
-                "id": info.get("id"),
-                "title": info.get("title"),
-                "thumbnail": info.get("thumbnail"),
-                "duration": duration,
-                "channel": info.get("channel") or info.get("uploader"),
-                "view_count": info.get("view_count"),
-                "platform": self._detect_platform(url),
-                "formats": formats,
+
+        if info:
+            with self._lock:
+                self._info_cache[url] = (time.monotonic(), info)
+
+        return info
+
+    def get_video_info(self, url: str) -> Dict[str, Any]:
+        """Fetch video metadata without downloading."""
+        url = self._normalize_url(url)
+        info = self._cached_extract(url)
+
+        if not info:
+            raise ValueError("Could not extract video info")
+
+        # Keep the best (highest bitrate) video format per height, one pass
+        by_height: Dict[int, Dict[str, Any]] = {}
+        for f in info.get("formats", ()):
+            height = f.get("height")
+            vcodec = f.get("vcodec")
+            if not height or vcodec is None or vcodec == "none":
+                continue
+            prev = by_height.get(height)
+            if prev is None or (f.get("tbr") or 0) > (prev.get("tbr") or 0):
+                by_height[height] = f
+
+        formats = [
+            {
+                "format_id": f.get("format_id"),
+                "resolution": f"{height}p",
+                "height": height,
+                "ext": f.get("ext"),
+                "type": "video",
+                "has_audio": f.get("acodec", "none") != "none",
+                "filesize": f.get("filesize") or f.get("filesize_approx"),
             }
+            for height, f in sorted(by_height.items(), reverse=True)
+        ]
+
+        duration = info.get("duration")
+        if isinstance(duration, float):
+            duration = int(duration)
+
+        return {
+            "id": info.get("id"),
+            "title": info.get("title"),
+            "thumbnail": info.get("thumbnail"),
+            "duration": duration,
+            "channel": info.get("channel") or info.get("uploader"),
+            "view_count": info.get("view_count"),
+            "platform": self._detect_platform(url),
+            "formats": formats,
+        }
             
     def _detect_platform(self, url: str) -> str:
-        """Detect platform from URL."""
-        if "youtube.com" in url or "youtu.be" in url:
-            return "youtube"
-        elif "tiktok.com" in url:
-            return "tiktok"
-        elif "instagram.com" in url:
-            return "instagram"
-        elif "facebook.com" in url or "fb.watch" in url:
-            return "facebook"
-        elif "twitter.com" in url or "x.com" in url:
-            return "twitter"
-        elif "twitch.tv" in url:
-            return "twitch"
+        """Detect platform from the URL hostname."""
+        host = (urlparse(url).hostname or "").lower().removeprefix("www.")
+
+        # Walk the domain suffixes so subdomains (m.youtube.com, vm.tiktok.com) match
+        while host:
+            platform = _PLATFORM_MAP.get(host)
+            if platform:
+                return platform
+            _, _, host = host.partition(".")
+
         return "other"
     
     def start_download(
@@ -261,25 +411,32 @@ class DownloadManager:
         output_path: Optional[str] = None,
         output_format: Optional[str] = None,  # mp4, mkv, avi, webm, mp3, wav, flac, aac, opus
         audio_quality: Optional[str] = None,  # 320, 256, 192, 128
-        callback: Optional[Callable[[DownloadTask], None]] = None
+        callback: Optional[Callable[[DownloadTaskSnapshot], None]] = None,
+        prefetched_info: Optional[Dict[str, Any]] = None  # info dict from a prior get_video_info
     ) -> str:
         """Start a download task and return task ID."""
         url = self._normalize_url(url)
-        task_id = str(uuid.uuid4())[:8]
-        
-        task = DownloadTask(
-            task_id=task_id,
-            url=url,
-            status=DownloadStatus.PENDING
-        )
-        
+
         with self._lock:
+            # 8 hex chars (32 bits) can collide over a long session; retry
+            # until the ID is free in the tasks map
+            while True:
+                task_id = secrets.token_hex(4)
+                if task_id not in self.tasks:
+                    break
+
+            task = DownloadTask(
+                task_id=task_id,
+                url=url,
+                status=DownloadStatus.PENDING
+            )
             self.tasks[task_id] = task
             if callback:
                 self._callbacks[task_id] = callback
         
         # Submit to thread pool
-        self.executor.submit(self._download_worker, task_id, url, format_type, quality, output_path, output_format, audio_quality)
+        self._queue_semaphore.acquire()
+        self.executor.submit(self._download_worker, task_id, url, format_type, quality, output_path, output_format, audio_quality, prefetched_info)
         
         return task_id
     
@@ -291,12 +448,14 @@ class DownloadManager:
         quality: str,
         output_path: Optional[str] = None,
         output_format: Optional[str] = None,
-        audio_quality: Optional[str] = None
+        audio_quality: Optional[str] = None,
+        prefetched_info: Optional[Dict[str, Any]] = None
     ) -> None:
         """Worker thread for downloading."""
         try:
             with self._lock:
                 task = self.tasks[task_id]
+            with task.lock:
                 task.status = DownloadStatus.FETCHING_INFO
             
             # Use custom output path or default
@@ -305,24 +464,12 @@ class DownloadManager:
             target_dir = os.path.abspath(target_dir)
             os.makedirs(target_dir, exist_ok=True)
             
-            # PRE-FETCH INFO to determine title and ensure consistency
-            # This is crucial to avoid mismatch between yt-dlp's sanitization and ours
-            pre_opts = {
-                "quiet": True, 
-                "no_warnings": True, 
-                "extract_flat": True 
-            }
-            with yt_dlp.YoutubeDL(pre_opts) as ydl_pre:
-                try:
-                    pre_info = ydl_pre.extract_info(url, download=False)
-                    # Sanitize title strictly using our function
-                    safe_title = sanitize_filename(pre_info.get('title', 'download'))
-                except Exception:
-                    # Fallback if pre-fetch fails
-                    safe_title = f"download_{task_id}"
-
-            if not safe_title:
-                safe_title = f"download_{task_id}"
+            # Seed title/thumbnail for the UI when the caller already has them;
+            # naming is handled by yt-dlp's own template, so no pre-fetch needed
+            if prefetched_info:
+                with task.lock:
+                    task.title = prefetched_info.get('title', '') or task.title
+                    task.thumbnail = prefetched_info.get('thumbnail', '') or task.thumbnail
 
             # Build format selector and postprocessors
             if format_type == "audio":
@@ -342,46 +489,42 @@ class DownloadManager:
                     "m4a": "m4a"
                 }
                 codec = codec_map.get(audio_fmt, "mp3")
-                ext = audio_fmt
-                
+
                 postprocessors = [{
                     "key": "FFmpegExtractAudio",
                     "preferredcodec": codec,
                     "preferredquality": audio_bitrate,
                 }]
                 merge_format = None
-                final_ext = ext
             else:
                 # Video format handling
                 video_fmt = output_format or "mp4"
-                ext = video_fmt
-                
+
                 if quality == "best":
                     format_selector = f"bestvideo+bestaudio/best"
                 else:
                     height = quality.replace("p", "")
                     format_selector = f"bestvideo[height<={height}]+bestaudio/best[height<={height}]/best"
                 
-                # Postprocessors for video conversion
-                if video_fmt in ["mkv", "avi", "webm"]:
-                    postprocessors = [{
-                        "key": "FFmpegVideoConvertor",
-                        "preferedformat": video_fmt,
-                    }]
+                # Postprocessors for video conversion.
+                # yt-dlp's merger already writes mp4/mkv containers with stream
+                # copy; forcing FFmpegVideoConvertor there would re-read and
+                # rewrite the whole file for nothing
+                if video_fmt in ["mp4", "mkv"]:
+                    postprocessors = []
                 else:
                     postprocessors = [{
                         "key": "FFmpegVideoConvertor",
-                        "preferedformat": "mp4",
+                        "preferedformat": video_fmt,
                     }]
                 
                 merge_format = video_fmt
-                final_ext = video_fmt
-            
-            # Use explicit filename template with our pre-sanitized title
-            outtmpl = os.path.join(target_dir, f"{safe_title}.%(ext)s")
 
-            ffmpeg_path = self._find_binary("ffmpeg.exe", "FFMPEG_PATH") or self._find_binary("ffmpeg", "FFMPEG_PATH")
-            ffmpeg_location = os.path.dirname(ffmpeg_path) if ffmpeg_path else None
+            # Let yt-dlp do the sanitization natively: length-limited title
+            # template plus restrictfilenames matches our old manual scheme
+            outtmpl = os.path.join(target_dir, "%(title).200B.%(ext)s")
+
+            ffmpeg_location = self._get_ffmpeg_location()
 
             ydl_opts = {
                 "format": format_selector,
@@ -391,8 +534,12 @@ class DownloadManager:
                 "quiet": True,
                 "no_warnings": True,
                 "merge_output_format": merge_format,
-                # We handle sanitization manually via explicit outtmpl
-                "restrictfilenames": False, 
+                "restrictfilenames": True,
+                "concurrent_fragment_downloads": self.fragment_concurrency,
+                "http_chunk_size": 10 * 1024 * 1024,
+                "cookiefile": self._cookiefile,
+                "cachedir": self._cachedir,
+                "http_headers": {"Connection": "keep-alive"},
             }
 
             if ffmpeg_location:
@@ -403,35 +550,73 @@ class DownloadManager:
                 
                 with self._lock:
                     task = self.tasks[task_id]
+                # Actual on-disk path after merging/postprocessing
+                requested = (info.get("requested_downloads") or [{}])[0]
+                final_path = requested.get("filepath") or info.get("filename")
+
+                with task.lock:
                     task.status = DownloadStatus.COMPLETED
                     task.progress = 100.0
                     task.title = info.get("title", "")
                     task.thumbnail = info.get("thumbnail", "")
-                    
-                    # Construct valid filename using the same logic
-                    task.filename = os.path.join(target_dir, f"{safe_title}.{final_ext}")
-        
+                    task.filename = final_path or task.filename
+
+        except yt_dlp.utils.DownloadCancelled:
+            with self._lock:
+                task = self.tasks[task_id]
+            with task.lock:
+                task.status = DownloadStatus.ERROR
+                task.error = task.error or "Cancelled by user"
         except Exception as e:
             with self._lock:
                 task = self.tasks[task_id]
+            with task.lock:
                 task.status = DownloadStatus.ERROR
                 task.error = str(e)
-        
+        finally:
+            self._queue_semaphore.release()
+
         # Final callback
-        if task_id in self._callbacks:
-            self._callbacks[task_id](self.tasks[task_id])
+        with self._lock:
+            task = self.tasks.get(task_id)
+            cb = self._callbacks.get(task_id)
+        if task and cb:
+            with task.lock:
+                snap = task.snapshot()
+            cb(snap)
     
     def get_task(self, task_id: str) -> Optional[DownloadTask]:
         """Get task by ID."""
         with self._lock:
             return self.tasks.get(task_id)
+
+    def get_tasks_snapshot(self) -> List[DownloadTaskSnapshot]:
+        """Snapshot all tasks in one pass for bulk refreshes.
+
+        One manager-lock acquisition instead of one get_task call per task,
+        and each entry is internally consistent.
+        """
+        with self._lock:
+            tasks = list(self.tasks.values())
+
+        snapshots = []
+        for task in tasks:
+            with task.lock:
+                snapshots.append(task.snapshot())
+        return snapshots
     
     def cancel_task(self, task_id: str) -> bool:
         """Cancel a download task."""
         with self._lock:
             task = self.tasks.get(task_id)
-            if task and task.status in [DownloadStatus.PENDING, DownloadStatus.DOWNLOADING]:
+        if not task:
+            return False
+
+        with task.lock:
+            if task.status in [DownloadStatus.PENDING, DownloadStatus.DOWNLOADING]:
                 task.status = DownloadStatus.ERROR
                 task.error = "Cancelled by user"
+                # Make the progress hook abort the running yt-dlp download
+                task.cancel_event.set()
                 return True
             return False
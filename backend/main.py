@@ -95,6 +95,7 @@ class DownloadRequest(BaseModel):
     output_path: Optional[str] = None
     output_format: Optional[str] = None  # mp4, mkv, avi, webm, mp3, wav, flac
     audio_quality: Optional[str] = None  # 320, 256, 192, 128
+    prefetched_info: Optional[dict] = None  # info dict from a prior /info call
 
 
 class DownloadResponse(BaseModel):
@@ -844,7 +845,8 @@ async def start_download(request: DownloadRequest):
             quality=request.quality,
             output_path=request.output_path,
             output_format=request.output_format,
-            audio_quality=request.audio_quality
+            audio_quality=request.audio_quality,
+            prefetched_info=request.prefetched_info
         )
         
         return DownloadResponse(